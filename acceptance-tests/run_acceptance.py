@@ -23,27 +23,47 @@ import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import jsonschema
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_JSON_PATH_RE = re.compile(r"\(details:\s+(/\S+\.json)\)")
+
+# Status markers as UTF-8 bytes so output can be checked without decoding it
+_SUCCESS_MARKER = "\u2705".encode()
+_FAILURE_MARKER = "\u274c".encode()
+
+# Wrapper file suffix -> interpreter used to run it
+_INTERPRETERS = {".js": "node", ".php": "php", ".py": "python3"}
+
 
 class AcceptanceResult:
     def __init__(self, name: str):
         self.name = name
-        self.checks: list[tuple[str, bool, str]] = []
+        # Parallel lists, one entry per check, rather than a tuple per check
+        self.labels: list[str] = []
+        self.oks: list[bool] = []
+        self.details: list[str] = []
 
     def check(self, label: str, passed: bool, detail: str = "") -> None:
-        self.checks.append((label, passed, detail))
+        self.labels.append(label)
+        self.oks.append(passed)
+        self.details.append(detail)
 
     @property
     def passed(self) -> bool:
-        return all(ok for _, ok, _ in self.checks)
+        return all(self.oks)
 
     def report(self) -> str:
         lines = [f"\n{'=' * 60}", f"  {self.name}", f"{'=' * 60}"]
-        for label, ok, detail in self.checks:
-            icon = "PASS" if ok else "FAIL"
+        for label, ok, detail in zip(self.labels, self.oks, self.details):
+            icon = ("FAIL", "PASS")[ok]
             line = f"  [{icon}] {label}"
             if detail:
                 line += f" - {detail}"
@@ -53,14 +73,22 @@ class AcceptanceResult:
         return "\n".join(lines)
 
 
+def load_json_file(path: str) -> object:
+    """Read and parse a JSON file in one go, using orjson when available."""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
 def find_json_path(output: str) -> str | None:
     """Extract the JSON details path from wrapper output."""
-    match = re.search(r"\(details:\s+(/\S+\.json)\)", output)
+    match = _JSON_PATH_RE.search(output)
     return match.group(1) if match else None
 
 
 def test_pass_fixture(
-    wrapper_cmd: list[str], fixture_dir: Path, schema: dict
+    wrapper_cmd: list[str],
+    fixture_dir: Path,
+    validator: jsonschema.protocols.Validator,
 ) -> AcceptanceResult:
     """Test wrapper against passing fixture."""
     result = AcceptanceResult("Pass Fixture")
@@ -68,13 +96,12 @@ def test_pass_fixture(
     proc = subprocess.run(
         wrapper_cmd + ["src/"],
         capture_output=True,
-        text=True,
         cwd=str(fixture_dir),
         timeout=30,
     )
     # Use stdout for output checks; stderr may contain runtime warnings
-    output = proc.stdout
-    combined = proc.stdout + proc.stderr
+    output = proc.stdout.decode("utf-8", "replace")
+    combined_text = output + proc.stderr.decode("utf-8", "replace")
 
     # Exit code should be 0
     result.check("Exit code is 0", proc.returncode == 0, f"got {proc.returncode}")
@@ -82,8 +109,8 @@ def test_pass_fixture(
     # Output should contain success marker (check both streams)
     result.check(
         "Output contains success marker",
-        "\u2705" in combined,
-        repr(combined[:100]),
+        _SUCCESS_MARKER in proc.stdout or _SUCCESS_MARKER in proc.stderr,
+        repr(combined_text[:100]),
     )
 
     # Should be single line (terse) - only count wrapper's own output lines
@@ -93,18 +120,19 @@ def test_pass_fixture(
     )
 
     # JSON file should exist and validate against schema
-    json_path = find_json_path(combined)
+    json_path = find_json_path(combined_text)
     result.check("JSON path found in output", json_path is not None)
 
-    if json_path and os.path.exists(json_path):
-        with open(json_path) as f:
-            data = json.load(f)
+    if json_path and Path(json_path).is_file():
+        data = load_json_file(json_path)
 
-        try:
-            jsonschema.validate(data, schema)
-            result.check("JSON validates against schema", True)
-        except jsonschema.ValidationError as e:
-            result.check("JSON validates against schema", False, str(e.message)[:100])
+        # Stop at the first schema error; only pass/fail and one message are needed
+        error = next(validator.iter_errors(data), None)
+        result.check(
+            "JSON validates against schema",
+            error is None,
+            "" if error is None else str(error.message)[:100],
+        )
 
         # Verify it's valid JSON (non-empty)
         is_non_empty = (isinstance(data, list) and len(data) > 0) or (
@@ -118,7 +146,9 @@ def test_pass_fixture(
 
 
 def test_fail_fixture(
-    wrapper_cmd: list[str], fixture_dir: Path, schema: dict
+    wrapper_cmd: list[str],
+    fixture_dir: Path,
+    validator: jsonschema.protocols.Validator,
 ) -> AcceptanceResult:
     """Test wrapper against failing fixture."""
     result = AcceptanceResult("Fail Fixture")
@@ -126,13 +156,12 @@ def test_fail_fixture(
     proc = subprocess.run(
         wrapper_cmd + ["src/"],
         capture_output=True,
-        text=True,
         cwd=str(fixture_dir),
         timeout=30,
     )
     # Use stdout for output checks; stderr may contain runtime warnings
-    output = proc.stdout
-    combined = proc.stdout + proc.stderr
+    output = proc.stdout.decode("utf-8", "replace")
+    combined_text = output + proc.stderr.decode("utf-8", "replace")
 
     # Exit code should be 1
     result.check("Exit code is 1", proc.returncode == 1, f"got {proc.returncode}")
@@ -140,8 +169,8 @@ def test_fail_fixture(
     # Output should contain failure marker (check both streams)
     result.check(
         "Output contains failure marker",
-        "\u274c" in combined,
-        repr(combined[:100]),
+        _FAILURE_MARKER in proc.stdout or _FAILURE_MARKER in proc.stderr,
+        repr(combined_text[:100]),
     )
 
     # Should be 2-5 lines (terse but informative) - only count wrapper's own output
@@ -153,18 +182,19 @@ def test_fail_fixture(
     )
 
     # JSON file should exist and validate
-    json_path = find_json_path(combined)
+    json_path = find_json_path(combined_text)
     result.check("JSON path found in output", json_path is not None)
 
-    if json_path and os.path.exists(json_path):
-        with open(json_path) as f:
-            data = json.load(f)
+    if json_path and Path(json_path).is_file():
+        data = load_json_file(json_path)
 
-        try:
-            jsonschema.validate(data, schema)
-            result.check("JSON validates against schema", True)
-        except jsonschema.ValidationError as e:
-            result.check("JSON validates against schema", False, str(e.message)[:100])
+        # Stop at the first schema error; only pass/fail and one message are needed
+        error = next(validator.iter_errors(data), None)
+        result.check(
+            "JSON validates against schema",
+            error is None,
+            "" if error is None else str(error.message)[:100],
+        )
 
         # Verify it's valid JSON (non-empty)
         is_non_empty = (isinstance(data, list) and len(data) > 0) or (
@@ -184,27 +214,28 @@ def test_no_args(wrapper_cmd: list[str], wrapper_dir: Path) -> AcceptanceResult:
     proc = subprocess.run(
         wrapper_cmd,
         capture_output=True,
-        text=True,
         cwd=str(wrapper_dir),
         timeout=30,
     )
-    combined = proc.stdout + proc.stderr
 
     result.check("Exit code is 2", proc.returncode == 2, f"got {proc.returncode}")
-    result.check("Output contains error marker", "\u274c" in combined, repr(combined[:100]))
+    result.check(
+        "Output contains error marker",
+        _FAILURE_MARKER in proc.stdout or _FAILURE_MARKER in proc.stderr,
+        repr((proc.stdout + proc.stderr).decode("utf-8", "replace")[:100]),
+    )
 
     return result
 
 
 def detect_wrapper_command(wrapper_dir: Path) -> list[str] | None:
     """Detect how to run the wrapper based on files present."""
-    for f in wrapper_dir.iterdir():
-        if f.name.startswith("llm-") and f.suffix == ".js":
-            return ["node", str(f)]
-        if f.name.startswith("llm-") and f.suffix == ".php":
-            return ["php", str(f)]
-        if f.name.startswith("llm-") and f.suffix == ".py":
-            return ["python3", str(f)]
+    with os.scandir(wrapper_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("llm-"):
+                interpreter = _INTERPRETERS.get(os.path.splitext(entry.name)[1])
+                if interpreter:
+                    return [interpreter, entry.path]
     return None
 
 
@@ -231,24 +262,32 @@ def main() -> int:
     with open(schema_path) as f:
         schema = json.load(f)
 
+    # Build the validator once (honouring the schema's $schema draft) and
+    # share it across fixtures rather than re-checking the schema per call
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+
     print(f"\nWrapper: {wrapper_cmd}")
     print(f"Fixtures: {fixture_dir}")
     print(f"Schema: {schema_path}")
 
-    results: list[AcceptanceResult] = []
-
-    # Test pass fixture
+    # Fixture runs are independent and block on subprocess I/O, so run them
+    # concurrently; results are collected in submission order for reporting
     pass_dir = fixture_dir / "pass"
-    if pass_dir.exists():
-        results.append(test_pass_fixture(wrapper_cmd, pass_dir, schema))
-
-    # Test fail fixture
     fail_dir = fixture_dir / "fail"
-    if fail_dir.exists():
-        results.append(test_fail_fixture(wrapper_cmd, fail_dir, schema))
-
-    # Test no-args error
-    results.append(test_no_args(wrapper_cmd, wrapper_dir))
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = []
+        if pass_dir.exists():
+            futures.append(
+                executor.submit(test_pass_fixture, wrapper_cmd, pass_dir, validator)
+            )
+        if fail_dir.exists():
+            futures.append(
+                executor.submit(test_fail_fixture, wrapper_cmd, fail_dir, validator)
+            )
+        futures.append(executor.submit(test_no_args, wrapper_cmd, wrapper_dir))
+        results: list[AcceptanceResult] = [f.result() for f in futures]
 
     # Report
     all_passed = True
@@ -7,17 +7,33 @@ rather than reconstructing JSON from a programmatic API. The wrapper
 adds a thin envelope with metadata around the native output.
 """
 
+import functools
 import json
+import os
 import subprocess
 import sys
 import tempfile
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_SHELL_EXTS = frozenset({".sh", ".bash", ".ksh", ".zsh"})
+
+
+def dumps_json(data: dict) -> bytes:
+    """Serialize data as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
 
 def find_shell_files(targets: list[str]) -> list[str]:
     """Find shell script files in the given targets."""
-    extensions = {".sh", ".bash", ".ksh", ".zsh"}
     files: list[str] = []
 
     for target in targets:
@@ -25,12 +41,22 @@ def find_shell_files(targets: list[str]) -> list[str]:
         if p.is_file():
             files.append(str(p.resolve()))
         elif p.is_dir():
-            for ext in extensions:
-                files.extend(str(f.resolve()) for f in p.rglob(f"*{ext}"))
+            # Single walk filtering on suffix, rather than one rglob per extension.
+            # The root is resolved once; paths below it are joined, not resolved
+            # per file, so symlinked scripts keep their in-tree path.
+            for root, _, names in os.walk(os.path.realpath(target)):
+                for name in names:
+                    if os.path.splitext(name)[1] in _SHELL_EXTS:
+                        files.append(os.path.join(root, name))
     return sorted(files)
 
 
+@functools.lru_cache(maxsize=1)
 def get_shellcheck_version() -> str:
+    # Allow callers (e.g. CI) to supply the version and skip the subprocess
+    env_version = os.environ.get("SHELLCHECK_VERSION")
+    if env_version:
+        return env_version
     try:
         proc = subprocess.run(
             ["shellcheck", "--version"], capture_output=True, text=True, timeout=10
@@ -77,15 +103,17 @@ def main() -> int:
         sys.stderr.write("❌ ShellCheck: Failed to parse JSON output\n")
         return 2
 
-    error_count = sum(1 for r in issues if r.get("level") == "error")
-    warning_count = sum(1 for r in issues if r.get("level") == "warning")
-    info_count = sum(1 for r in issues if r.get("level") == "info")
-    style_count = sum(1 for r in issues if r.get("level") == "style")
+    levels = Counter(r.get("level") for r in issues)
+    error_count = levels["error"]
+    warning_count = levels["warning"]
+    info_count = levels["info"]
+    style_count = levels["style"]
 
+    timestamp = datetime.now(timezone.utc).isoformat()
     output = {
         "tool": "shellcheck",
         "version": get_shellcheck_version(),
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": timestamp,
         "exit_code": 0 if len(issues) == 0 else 1,
         "command": f"shellcheck -f json {' '.join(targets)}",
         "summary": {
@@ -101,9 +129,9 @@ def main() -> int:
 
     # Write JSON output to temp file
     tmp = tempfile.NamedTemporaryFile(
-        prefix="shellcheck-", suffix=".json", delete=False, mode="w"
+        prefix="shellcheck-", suffix=".json", delete=False, mode="wb"
     )
-    json.dump(output, tmp, indent=2)
+    tmp.write(dumps_json(output))
     tmp.close()
 
     if len(issues) == 0:
@@ -6,7 +6,9 @@ shfmt has no native JSON output mode, so this wrapper runs shfmt -d
 to get diff output and parses it into structured JSON.
 """
 
+import functools
 import json
+import os
 import re
 import subprocess
 import sys
@@ -14,10 +16,26 @@ import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_SHELL_EXTS = frozenset({".sh", ".bash", ".ksh", ".zsh"})
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+_ORIG_RE = re.compile(r"^--- (.+)\.orig$")
+_HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def dumps_json(data: dict) -> bytes:
+    """Serialize data as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
 
 def find_shell_files(targets: list[str]) -> list[str]:
     """Find shell script files in the given targets."""
-    extensions = {".sh", ".bash", ".ksh", ".zsh"}
     files: list[str] = []
 
     for target in targets:
@@ -25,25 +43,30 @@ def find_shell_files(targets: list[str]) -> list[str]:
         if p.is_file():
             files.append(str(p.resolve()))
         elif p.is_dir():
-            for ext in extensions:
-                files.extend(str(f.resolve()) for f in p.rglob(f"*{ext}"))
+            # Single walk filtering on suffix, rather than one rglob per extension.
+            # The root is resolved once; paths below it are joined, not resolved
+            # per file, so symlinked scripts keep their in-tree path.
+            for root, _, names in os.walk(os.path.realpath(target)):
+                for name in names:
+                    if os.path.splitext(name)[1] in _SHELL_EXTS:
+                        files.append(os.path.join(root, name))
     return sorted(files)
 
 
-def strip_ansi(text: str) -> str:
-    """Remove ANSI escape codes from text."""
-    return re.sub(r"\x1b\[[0-9;]*m", "", text)
-
-
 def parse_diff(diff_text: str) -> list[dict]:
     """Parse unified diff output into structured file results."""
-    diff_text = strip_ansi(diff_text)
     files: dict[str, list[dict]] = {}
     current_file = None
 
     for line in diff_text.splitlines():
+        # Only header lines carry data we parse; skip context/+/- lines early.
+        # Lines led by an ANSI escape may still be colourised headers.
+        if not (line[:4] == "--- " or line[:3] == "@@ " or line[:1] == "\x1b"):
+            continue
+        line = _ANSI_RE.sub("", line)
+
         # Match diff header: --- path.orig / +++ path
-        orig_match = re.match(r"^--- (.+)\.orig$", line)
+        orig_match = _ORIG_RE.match(line)
         if orig_match:
             current_file = orig_match.group(1)
             if current_file not in files:
@@ -51,7 +74,7 @@ def parse_diff(diff_text: str) -> list[dict]:
             continue
 
         # Match hunk header: @@ -start,count +start,count @@
-        hunk_match = re.match(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@", line)
+        hunk_match = _HUNK_RE.match(line)
         if hunk_match and current_file:
             files[current_file].append({
                 "original_start": int(hunk_match.group(1)),
@@ -60,18 +83,23 @@ def parse_diff(diff_text: str) -> list[dict]:
                 "formatted_count": int(hunk_match.group(4) or 1),
             })
 
-    results = []
-    for file_path, hunks in files.items():
-        results.append({
+    return [
+        {
             "file_path": file_path,
             "formatted": False,
             "diff_count": len(hunks),
             "hunks": hunks,
-        })
-    return results
+        }
+        for file_path, hunks in files.items()
+    ]
 
 
+@functools.lru_cache(maxsize=1)
 def get_shfmt_version() -> str:
+    # Allow callers (e.g. CI) to supply the version and skip the subprocess
+    env_version = os.environ.get("SHFMT_VERSION")
+    if env_version:
+        return env_version
     try:
         proc = subprocess.run(
             ["shfmt", "--version"], capture_output=True, text=True, timeout=10
@@ -118,25 +146,25 @@ def main() -> int:
         unformatted = []
 
     # Build results for all files
-    unformatted_paths = {r["file_path"] for r in unformatted}
-    results = []
-    for f in files:
-        if f in unformatted_paths:
-            results.append(next(r for r in unformatted if r["file_path"] == f))
-        else:
-            results.append({
-                "file_path": f,
-                "formatted": True,
-                "diff_count": 0,
-                "hunks": [],
-            })
-
-    unformatted_count = len(unformatted_paths)
-
+    unformatted_by_path = {r["file_path"]: r for r in unformatted}
+    results = [
+        unformatted_by_path.get(f)
+        or {
+            "file_path": f,
+            "formatted": True,
+            "diff_count": 0,
+            "hunks": [],
+        }
+        for f in files
+    ]
+
+    unformatted_count = len(unformatted_by_path)
+
+    timestamp = datetime.now(timezone.utc).isoformat()
     output = {
         "tool": "shfmt",
         "version": get_shfmt_version(),
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": timestamp,
         "exit_code": 1 if unformatted_count > 0 else 0,
         "command": f"shfmt -d {' '.join(targets)}",
         "summary": {
@@ -149,9 +177,9 @@ def main() -> int:
     }
 
     tmp = tempfile.NamedTemporaryFile(
-        prefix="shfmt-", suffix=".json", delete=False, mode="w"
+        prefix="shfmt-", suffix=".json", delete=False, mode="wb"
     )
-    json.dump(output, tmp, indent=2)
+    tmp.write(dumps_json(output))
     tmp.close()
 
     if unformatted_count == 0:
@@ -12,6 +12,25 @@ import sys
 import tempfile
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(data: dict) -> bytes:
+    """Serialize data as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def loads_json(text: str) -> list:
+    """Parse JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 def main() -> int:
     targets = sys.argv[1:]
@@ -35,18 +54,23 @@ def main() -> int:
             sys.stderr.write(f"❌ MyPy: Execution error - {msg[:200]}\n")
             return 2
 
-        # Parse JSONL output (one JSON object per line)
-        results = []
-        for line in proc.stdout.strip().splitlines():
-            line = line.strip()
-            if line:
-                results.append(json.loads(line))
+        # Parse JSONL output (one JSON object per line) with one parser call
+        # over a synthesized array, then tally severities in a single pass
+        lines = [line for line in proc.stdout.splitlines() if line.strip()]
+        results = loads_json("[" + ",".join(lines) + "]") if lines else []
+        errors = []
+        note_count = 0
+        error_files: set[str] = set()
+        for r in results:
+            severity = r.get("severity")
+            if severity == "error":
+                errors.append(r)
+                error_files.add(r["file"])
+            elif severity == "note":
+                note_count += 1
 
-        error_count = sum(1 for r in results if r.get("severity") == "error")
-        note_count = sum(1 for r in results if r.get("severity") == "note")
-        files_with_errors = len({
-            r["file"] for r in results if r.get("severity") == "error"
-        })
+        error_count = len(errors)
+        files_with_errors = len(error_files)
 
         output = {
             "tool": "mypy",
@@ -61,9 +85,9 @@ def main() -> int:
         }
 
         tmp = tempfile.NamedTemporaryFile(
-            prefix="mypy-", suffix=".json", delete=False, mode="w"
+            prefix="mypy-", suffix=".json", delete=False, mode="wb"
         )
-        json.dump(output, tmp, indent=2)
+        tmp.write(dumps_json(output))
         tmp.close()
 
         if error_count == 0:
@@ -73,7 +97,6 @@ def main() -> int:
             sys.stdout.write(
                 f"❌ MyPy: {error_count} errors in {files_with_errors} files\n"
             )
-            errors = [r for r in results if r.get("severity") == "error"]
             for e in errors[:3]:
                 sys.stdout.write(
                     f"   - {e['file']}:{e['line']}:{e['column']} "
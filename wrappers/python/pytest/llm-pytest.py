@@ -6,29 +6,64 @@ pytest does not provide native JSON output, so this wrapper
 parses the result and constructs structured JSON.
 """
 
+import importlib.util
 import json
+import os
 import re
 import subprocess
 import sys
 import tempfile
+import threading
+from collections.abc import Iterable
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def parse_pytest_output(stdout: str, stderr: str) -> dict:
-    """Parse pytest verbose output into structured data."""
-    lines = stdout.splitlines()
+_TEST_RE = re.compile(r"^(.+?)::(\S+)\s+(PASSED|FAILED|ERROR|SKIPPED)")
+_XDIST_TEST_RE = re.compile(
+    r"^\[gw\d+\] \[\s*\d+%\] (PASSED|FAILED|ERROR|SKIPPED) (.+?)::(\S+)"
+)
+_SUMMARY_RE = re.compile(r"=+ (.+) =+\s*$")
+# Lines never part of failure details; "[gwN] linux -- Python ..." lines are
+# xdist worker banners
+_SKIP_PREFIXES = ("_ _ _ _ _", "FAILED", "[gw")
+
+
+def dumps_json(data: dict) -> bytes:
+    """Serialize data as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def parse_pytest_output(lines: Iterable[str]) -> dict:
+    """Parse pytest verbose output into structured data in a single pass."""
     tests = []
     passed = 0
     failed = 0
     errors = 0
     skipped = 0
+    failure_details = []
+    in_failures = False
+    current_failure = None
+    summary_line = ""
 
-    # Parse individual test results from -v output
     for line in lines:
+        line = line.rstrip("\n")
+
+        # Parse individual test results from -v output
         # Matches lines like: src/test_clean.py::test_addition PASSED
-        match = re.match(r"^(.+?)::(\S+)\s+(PASSED|FAILED|ERROR|SKIPPED)", line)
-        if match:
-            file_path, test_name, status = match.groups()
+        # or, under xdist: [gw0] [ 33%] PASSED src/test_clean.py::test_addition
+        match = _TEST_RE.match(line)
+        xdist_match = None if match else _XDIST_TEST_RE.match(line)
+        if match or xdist_match:
+            if match:
+                file_path, test_name, status = match.groups()
+            else:
+                status, file_path, test_name = xdist_match.groups()
             status_lower = status.lower()
             tests.append({
                 "file_path": file_path,
@@ -44,20 +79,22 @@ def parse_pytest_output(stdout: str, stderr: str) -> dict:
             elif status == "SKIPPED":
                 skipped += 1
 
-    # Parse failure details from FAILURES section
-    failure_details = []
-    in_failures = False
-    current_failure = None
-    for line in lines:
-        if line.startswith("_ _ _ _ _") or line.startswith("FAILED"):
-            continue
-        if line.startswith("=") and "FAILURES" in line:
-            in_failures = True
-            continue
-        if line.startswith("=") and in_failures:
-            in_failures = False
+        # Parse failure details from FAILURES section
+        if line.startswith(_SKIP_PREFIXES):
             continue
-        if in_failures and line.startswith("___") and "___" in line:
+        if line[:3] == "===":
+            # Summary line: "=== 2 failed, 1 passed in 0.01s ===" is the last
+            # separator pytest prints, so keep the most recent match
+            summary_match = _SUMMARY_RE.search(line)
+            if summary_match:
+                summary_line = summary_match.group(1)
+            if "FAILURES" in line:
+                in_failures = True
+                continue
+            if in_failures:
+                in_failures = False
+                continue
+        if in_failures and line.startswith("___"):
             name = line.strip("_ ").strip()
             current_failure = {"test_name": name, "details": []}
             failure_details.append(current_failure)
@@ -68,10 +105,6 @@ def parse_pytest_output(stdout: str, stderr: str) -> dict:
     for fd in failure_details:
         fd["details"] = "\n".join(fd["details"]).strip()
 
-    # Parse summary line: "2 failed, 1 passed"
-    summary_match = re.search(r"=+ (.+) =+\s*$", stdout, re.MULTILINE)
-    summary_line = summary_match.group(1) if summary_match else ""
-
     return {
         "tool": "pytest",
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -88,6 +121,50 @@ def parse_pytest_output(stdout: str, stderr: str) -> dict:
     }
 
 
+def xdist_args() -> list[str]:
+    """Return pytest-xdist arguments when the plugin is installed and worthwhile.
+
+    The probe runs in this interpreter, so pytest must be launched with
+    sys.executable for the result to hold for the child process.
+    """
+    if importlib.util.find_spec("xdist") is None:
+        return []
+    # Leave two cores of headroom; a single worker only adds overhead
+    workers = (os.cpu_count() or 1) - 2
+    return ["-n", str(workers)] if workers > 1 else []
+
+
+def run_pytest(cmd: list[str], timeout: float) -> tuple[int, dict, str]:
+    """Run pytest, parsing stdout as it streams. Returns (exit code, result, stderr)."""
+    # stderr goes to a temp file so an unread pipe can never stall pytest
+    with tempfile.TemporaryFile(mode="w+") as stderr_file:
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True
+        ) as proc:
+            timed_out = threading.Event()
+
+            def kill() -> None:
+                timed_out.set()
+                proc.kill()
+
+            # Enforce the timeout while stdout is still being consumed
+            timer = threading.Timer(timeout, kill)
+            timer.start()
+            try:
+                result = parse_pytest_output(proc.stdout)
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+
+        # The timer may fire just after pytest exits on its own; only a
+        # signal-terminated process counts as a real timeout
+        if timed_out.is_set() and returncode < 0:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        stderr_file.seek(0)
+        return returncode, result, stderr_file.read()
+
+
 def main() -> int:
     targets = sys.argv[1:]
 
@@ -97,24 +174,30 @@ def main() -> int:
         return 2
 
     try:
-        proc = subprocess.run(
-            ["python3", "-m", "pytest", "-v", "--tb=short", "--no-header", "--color=no", *targets],
-            capture_output=True,
-            text=True,
-            timeout=120,
+        base_cmd = [
+            sys.executable, "-m", "pytest", "-v", "--tb=short", "--no-header", "--color=no"
+        ]
+        parallel = xdist_args()
+        returncode, result, stderr = run_pytest(
+            [*base_cmd, *parallel, *targets], timeout=120
         )
 
-        if proc.returncode not in (0, 1):
-            msg = proc.stderr.strip() or proc.stdout.strip()
+        # A suite that disables xdist (e.g. "-p no:xdist" in addopts) rejects
+        # -n as a usage error (exit 4); rerun serially instead of erroring
+        if parallel and returncode == 4:
+            returncode, result, stderr = run_pytest(
+                [*base_cmd, *targets], timeout=120
+            )
+
+        if returncode not in (0, 1):
+            msg = stderr.strip() or result["summary"]["summary_line"]
             sys.stderr.write(f"❌ pytest: Execution error - {msg[:200]}\n")
             return 2
 
-        result = parse_pytest_output(proc.stdout, proc.stderr)
-
         tmp = tempfile.NamedTemporaryFile(
-            prefix="pytest-", suffix=".json", delete=False, mode="w"
+            prefix="pytest-", suffix=".json", delete=False, mode="wb"
         )
-        json.dump(result, tmp, indent=2)
+        tmp.write(dumps_json(result))
         tmp.close()
 
         s = result["summary"]
@@ -12,6 +12,18 @@ import sys
 import tempfile
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(data: dict) -> bytes:
+    """Serialize data as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
 
 def main() -> int:
     targets = sys.argv[1:]
@@ -52,9 +64,9 @@ def main() -> int:
         }
 
         tmp = tempfile.NamedTemporaryFile(
-            prefix="ruff-", suffix=".json", delete=False, mode="w"
+            prefix="ruff-", suffix=".json", delete=False, mode="wb"
         )
-        json.dump(output, tmp, indent=2)
+        tmp.write(dumps_json(output))
         tmp.close()
 
         if error_count == 0: